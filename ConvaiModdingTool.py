@@ -1,14 +1,12 @@
 import os
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import sys
 
 from core.config_manager import config
-from core.download_utils import DownloadManager
 from core.exceptions import ConvaiToolError
 from core.file_utility_manager import FileUtilityManager
 from core.input_manager import InputManager
 from core.logger import logger, suppress_external_logging
-from core.unreal_engine_manager import UnrealEngineManager
 from core.version_manager import VersionManager
 
 TOOL_VERSION = "3.0.4"
@@ -17,18 +15,19 @@ def get_script_dir():
     if getattr(sys, 'frozen', False):
         return os.path.dirname(os.path.abspath(sys.executable))
     else:
-        return Path(__file__).resolve().parent.parent
+        return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 #Managers
 input_manager = InputManager(get_script_dir())
 
-def CreateModdingProject():
+def CreateModdingProject(ue_dir: str):
     """Main execution flow for setting up an Unreal Engine project."""  
+    # Engine/download machinery is only imported once a flow actually needs it
+    from core.download_utils import DownloadManager
+    from core.unreal_engine_manager import UnrealEngineManager
+    
     logger.section("Creating New Modding Project")
 
-    FileUtilityManager.validate_ubt_configuration()
-
-    ue_dir = input_manager.get_unreal_engine_path("current")
     project_name = input_manager.get_project_name()
     project_dir = os.path.join(input_manager.get_script_dir(), project_name)
     
@@ -44,13 +43,17 @@ def CreateModdingProject():
         logger.error("Failed to build project structure")
         return
     
-    logger.step("Creating content plugin...")
-    plugin_name = FileUtilityManager.trim_unique_str(FileUtilityManager.generate_unique_str())
-    ue_manager.create_content_only_plugin(plugin_name)
-    ue_manager.update_ini_files(plugin_name, convai_api_key)
-    
+    # Dependency download is network-bound; run it while the local plugin/INI setup happens
     logger.step("Downloading Convai dependencies...")
-    DownloadManager.download_modding_dependencies(project_dir)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        download_future = executor.submit(DownloadManager.download_modding_dependencies, project_dir)
+        
+        logger.step("Creating content plugin...")
+        plugin_name = FileUtilityManager.trim_unique_str(FileUtilityManager.generate_unique_str())
+        ue_manager.create_content_only_plugin(plugin_name)
+        ue_manager.update_ini_files(plugin_name, convai_api_key)
+        
+        download_future.result()
     
     logger.step("Enabling required plugins...")
     required_plugins = (config.get_required_plugins() + [plugin_name] + (config.get_metahuman_plugins() if is_metahuman else []))
@@ -73,13 +76,12 @@ def CreateModdingProject():
     
     logger.success("Modding project created successfully!")
 
-def UpdateModdingProject():
+def UpdateModdingProject(ue_dir: str):
     """Main execution flow for updating an existing Unreal Engine modding project."""
-    logger.section("Updating Existing Modding Project")
+    from core.unreal_engine_manager import UnrealEngineManager
     
-    FileUtilityManager.validate_ubt_configuration()
+    logger.section("Updating Existing Modding Project")
     
-    ue_dir = input_manager.get_unreal_engine_path("current")
     project_dir = input_manager.choose_project_dir()
 
     logger.step("Loading project configuration...")
@@ -104,15 +106,14 @@ def UpdateModdingProject():
     
     logger.success("Modding project updated successfully!")
 
-def MigrateModdingProject():
+def MigrateModdingProject(current_ue_dir: str):
     """Main execution flow for migrating an existing Unreal Engine modding project to a new UE version."""
-    logger.section("Migrate Existing Modding Project")
+    from core.unreal_engine_manager import UnrealEngineManager
     
-    FileUtilityManager.validate_ubt_configuration()
+    logger.section("Migrate Existing Modding Project")
     
     # Step 1: Select and update original project
     original_project_dir = input_manager.choose_project_dir()
-    current_ue_dir = input_manager.get_unreal_engine_path("current")
     
     # Load project metadata
     metadata = FileUtilityManager.get_metadata(original_project_dir)        
@@ -182,6 +183,11 @@ def MigrateModdingProject():
     logger.success(f"Successfully migrated project to {migrated_directory_name} with Unreal Engine {target_ue_version}!")
     logger.info(f"Migrated project location: {migrated_project_dir}")
     
+def _preflight() -> str:
+    """Checks shared by every flow; returns the current Unreal Engine directory."""
+    FileUtilityManager.validate_ubt_configuration()
+    return input_manager.get_unreal_engine_path("current")
+
 def main():
     
     if not VersionManager.check_version(TOOL_VERSION):
@@ -195,12 +201,13 @@ def main():
     user_choice = input_manager.get_user_flow_choice()
     
     try:
+        ue_dir = _preflight()
         if user_choice == "create":
-            CreateModdingProject()
+            CreateModdingProject(ue_dir)
         elif user_choice == "update":
-            UpdateModdingProject()
+            UpdateModdingProject(ue_dir)
         elif user_choice == "migrate":
-            MigrateModdingProject()
+            MigrateModdingProject(ue_dir)
     except ConvaiToolError as e:
         logger.error(f"Operation failed: {e}")
         sys.exit(1)
@@ -211,4 +218,9 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         logger.warning("\nOperation cancelled by user")
     finally:
-        input("\nPress Enter to exit...")
+        # Keep the console window open for interactive users; don't block scripted runs
+        if sys.stdin and sys.stdin.isatty():
+            try:
+                input("\nPress Enter to exit...")
+            except EOFError:
+                pass
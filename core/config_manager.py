@@ -1,9 +1,9 @@
-import json
 import time
 import requests
 from dataclasses import dataclass
 from typing import Dict, List, Any, Optional
 
+from core.http_session import http_session
 from core.logger import logger
 from core.exceptions import ConfigurationError
 
@@ -38,6 +38,7 @@ class ConfigManager:
         self._max_attempts = max_attempts
         self._timeout = timeout
         self._remote_config = self._load_remote_config()
+        self._flat_config = self._flatten(self._remote_config.config)
         self._initialized = True
     
     def _load_remote_config(self) -> RemoteConfig:
@@ -45,7 +46,7 @@ class ConfigManager:
         config_data = self._fetch_json(self.CONFIG_FILE_PATH)
         if not config_data:
             raise ConfigurationError(
-                f"Failed to load config after {self._max_attempts} attempts. "
+                "Failed to load config. "
                 "Please ensure GitHub is accessible."
             )
         
@@ -58,29 +59,42 @@ class ConfigManager:
         
         for attempt in range(self._max_attempts):
             try:
-                response = requests.get(url, timeout=self._timeout)
+                # The shared session already retries connection errors and 5xx with backoff
+                response = http_session.get(url, timeout=self._timeout)
                 response.raise_for_status()
+            except requests.RequestException as e:
+                logger.debug(f"Failed to fetch {file_path}: {e}")
+                return None
+            
+            try:
                 return response.json()
-            except (requests.RequestException, json.JSONDecodeError) as e:
-                logger.debug(f"Attempt {attempt + 1} failed for {file_path}: {e}")
+            except ValueError as e:
+                # A truncated or half-published file; fetch it again
+                logger.debug(f"Attempt {attempt + 1} returned invalid JSON for {file_path}: {e}")
                 if attempt < self._max_attempts - 1:
                     time.sleep(2 ** attempt)  # Exponential backoff: 1s, 2s, 4s, 8s
         return None
     
+    @staticmethod
+    def _flatten(data: Dict[str, Any], prefix: str = '') -> Dict[str, Any]:
+        """Map every dot-notation path in the config (sections and leaves) to its value."""
+        flat = {}
+        for key, value in data.items():
+            if '.' in key:
+                continue  # Not reachable through dot notation
+            path = prefix + key
+            flat[path] = value
+            if isinstance(value, dict):
+                flat.update(ConfigManager._flatten(value, path + '.'))
+        return flat
+    
     def get(self, key_path: str, default: Any = None) -> Any:
         """
         Get configuration value using dot notation.
         Example: get('unreal_engine.current_version')
         """
-        keys = key_path.split('.')
-        value = self._remote_config.config
-        
-        for key in keys:
-            if not isinstance(value, dict) or key not in value:
-                return default
-            value = value[key]
-        
-        return value
+        # Paths are resolved once at load time, so a lookup is a single dict access
+        return self._flat_config.get(key_path, default)
     
     def get_current_unreal_engine_version(self) -> str:
         """Get current Unreal Engine version from cached version data."""
@@ -98,6 +112,13 @@ class ConfigManager:
         logger.warning("Version data is not valid, returning 5.7 as target UE version")
         return '5.7'
     
+    def get_latest_modding_tool_version(self) -> Optional[str]:
+        """Get latest released modding tool version from cached version data, or None if it wasn't fetched."""
+        if not self._remote_config.version_data:
+            return None
+        version = self._remote_config.version_data.get('modding-tool-version', '')
+        return version.strip() if isinstance(version, str) else ''
+    
     def get_cross_compilation_toolchain(self, ue_version: str = None) -> str:
         """Get cross-compilation toolchain version for a specific UE version."""
         if ue_version is None:
@@ -132,6 +153,12 @@ class ConfigManager:
         directory = self.get('cross_compilation.toolchain_download_directory', '%APPDATA%\\ConvaiModdingTool\\Downloads')
         return os.path.expandvars(directory)
     
+    def get_cache_directory(self) -> str:
+        """Get directory for local caches that persist between runs."""
+        import os
+        directory = self.get('cache.directory', '%LOCALAPPDATA%\\ConvaiModdingTool\\Cache')
+        return os.path.expandvars(directory)
+    
     def get_cross_compilation_install_directory(self) -> str:
         """Get cross-compilation toolchain installation directory (for extracted toolchains)."""
         return self.get('cross_compilation.toolchain_install_directory', 'C:\\UnrealToolchains')
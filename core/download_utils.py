@@ -1,19 +1,25 @@
 import os
+import re
 import shutil
 import subprocess
 import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 
-import gdown
 import requests
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
 
 from core.config_manager import config
 from core.file_utility_manager import FileUtilityManager
-from core.github_manager import GitHubManager
+from core.github_manager import DOWNLOAD_BUFFER_SIZE, GitHubManager
+from core.http_session import http_session
 from core.plugin_manager import PluginManager
 from core.logger import logger
 
+GDRIVE_DOWNLOAD_URL = "https://drive.usercontent.google.com/download"
+GDRIVE_FORM_FIELD_PATTERN = re.compile(r'name="([^"]+)"\s+value="([^"]*)"')
+
 class DownloadManager:
     
     @staticmethod
@@ -30,22 +36,38 @@ class DownloadManager:
             Path to downloaded file or None if failed.
         """
 
-        if not os.path.exists(download_dir):
-            os.makedirs(download_dir)
+        os.makedirs(download_dir, exist_ok=True)
 
         destination_path = os.path.join(download_dir, filename)
-        url = f"https://drive.google.com/uc?id={file_id}"
+        params = {"id": file_id, "export": "download", "confirm": "t"}
         
         logger.debug(f"Downloading from Google Drive: {filename}")
-        gdown.download(url, destination_path, quiet=True)
-        
-        if os.path.exists(destination_path):
-            logger.debug(f"Google Drive download complete: {filename}")
-            return destination_path
-        else:
-            logger.error("Google Drive download failed")
+        try:
+            response = http_session.get(GDRIVE_DOWNLOAD_URL, params=params, stream=True, timeout=30)
+            response.raise_for_status()
+
+            # Files too large to virus-scan return a warning page whose form carries the real download parameters
+            if response.headers.get("Content-Type", "").startswith("text/html"):
+                form_fields = dict(GDRIVE_FORM_FIELD_PATTERN.findall(response.text))
+                response.close()
+                response = http_session.get(GDRIVE_DOWNLOAD_URL, params={**params, **form_fields}, stream=True, timeout=30)
+                response.raise_for_status()
+                if response.headers.get("Content-Type", "").startswith("text/html"):
+                    response.close()
+                    logger.error("Google Drive download failed: file is not publicly downloadable")
+                    return None
+
+            with response, open(destination_path, 'wb', buffering=DOWNLOAD_BUFFER_SIZE) as f:
+                response.raw.decode_content = True
+                shutil.copyfileobj(response.raw, f, length=DOWNLOAD_BUFFER_SIZE)
+        except (requests.RequestException, Urllib3HTTPError, OSError) as e:
+            logger.error(f"Google Drive download failed: {e}")
+            FileUtilityManager.delete_file_if_exists(destination_path)
             return None
 
+        logger.debug(f"Google Drive download complete: {filename}")
+        return destination_path
+
     @staticmethod
     def extract_plugin_zip(zip_path: str, project_dir: str) -> Optional[str]:
         """
@@ -57,63 +79,40 @@ class DownloadManager:
         plugins_dir = os.path.join(project_dir, "Plugins")
         os.makedirs(plugins_dir, exist_ok=True)
 
-        temp_dir = os.path.join(plugins_dir, "Temp_Extract_Plugin")
-        if os.path.exists(temp_dir):
-            shutil.rmtree(temp_dir, ignore_errors=True)
-        os.makedirs(temp_dir, exist_ok=True)
-
-        logger.debug(f"Unzipping plugin archive: {os.path.basename(zip_path)}")
-        FileUtilityManager.unzip(zip_path, temp_dir)
-
-        # Find a directory that contains a .uplugin file and capture its name
-        plugin_folder = None
-        uplugin_path = None
-        uplugin_name_no_ext = None
-        for root, _, files in os.walk(temp_dir):
-            for f in files:
-                if f.endswith(".uplugin"):
-                    plugin_folder = root
-                    uplugin_path = os.path.join(root, f)
-                    uplugin_name_no_ext = os.path.splitext(f)[0]
-                    break
-            if plugin_folder:
-                break
+        # Locate the .uplugin descriptor from the archive listing, so the plugin folder can be
+        # extracted straight into place instead of via a temp folder and a move
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            uplugin_names = [n for n in zip_ref.namelist() if n.endswith(".uplugin")]
 
-        if not plugin_folder or not uplugin_path:
-            logger.error("No .uplugin file found in extracted archive")
-            shutil.rmtree(temp_dir, ignore_errors=True)
+        if not uplugin_names:
+            logger.error("No .uplugin file found in archive")
             return None
 
+        uplugin_name = min(uplugin_names, key=lambda n: n.count("/"))
+        plugin_folder, _, uplugin_file = uplugin_name.rpartition("/")
+        plugin_prefix = f"{plugin_folder}/" if plugin_folder else ""
+
         # Decide final folder name from .uplugin (more reliable than inner folder names)
-        final_plugin_folder_name = uplugin_name_no_ext or os.path.basename(plugin_folder)
+        final_plugin_folder_name = os.path.splitext(uplugin_file)[0] or os.path.basename(plugin_folder)
         final_plugin_path = os.path.join(plugins_dir, final_plugin_folder_name)
 
-        logger.debug(f"Detected plugin folder: {plugin_folder}")
-        logger.debug(f"Detected plugin descriptor: {os.path.basename(uplugin_path)}")
+        logger.debug(f"Detected plugin folder: {plugin_folder or '<archive root>'}")
+        logger.debug(f"Detected plugin descriptor: {uplugin_file}")
         logger.debug(f"Installing plugin to: {final_plugin_path}")
 
         # Remove existing installation if present
         if os.path.exists(final_plugin_path):
             shutil.rmtree(final_plugin_path, ignore_errors=True)
 
+        logger.debug(f"Unzipping plugin archive: {os.path.basename(zip_path)}")
         try:
-            # If the .uplugin is at the zip root (plugin_folder == temp_dir),
-            # move the contents of temp_dir into final_plugin_path (not the temp dir itself)
-            if os.path.normpath(plugin_folder) == os.path.normpath(temp_dir):
-                os.makedirs(final_plugin_path, exist_ok=True)
-                for item in os.listdir(temp_dir):
-                    src_path = os.path.join(temp_dir, item)
-                    dst_path = os.path.join(final_plugin_path, item)
-                    shutil.move(src_path, dst_path)
-            else:
-                # Otherwise move the detected plugin folder as a whole
-                shutil.move(plugin_folder, final_plugin_path)
+            FileUtilityManager.unzip(zip_path, final_plugin_path, strip_prefix=plugin_prefix)
+        except Exception:
+            shutil.rmtree(final_plugin_path, ignore_errors=True)
+            raise
 
-            logger.debug(f"Plugin installed: {final_plugin_folder_name}")
-            return final_plugin_path
-        finally:
-            # Cleanup temporary extraction directory
-            shutil.rmtree(temp_dir, ignore_errors=True)
+        logger.debug(f"Plugin installed: {final_plugin_folder_name}")
+        return final_plugin_path
 
     @staticmethod
     def download_plugin_from_github(project_dir: str, plugin_name: str, version: str = None) -> bool:
@@ -189,14 +188,24 @@ class DownloadManager:
         
         # Download all configured GitHub plugins (excluding any specified)
         github_plugins = [p for p in config.get_github_plugins() if p not in exclude_plugins]
+        if not github_plugins:
+            return
         success_count = 0
         
-        for i, plugin_name in enumerate(github_plugins, 1):
-            logger.progress(i, len(github_plugins), f"Downloading {plugin_name.replace('_', ' ').title()}")
-            if DownloadManager.download_plugin_from_github(project_dir, plugin_name):
-                success_count += 1
-            else:
-                logger.warning(f"Failed to download {plugin_name}")
+        # Each plugin lands in its own folder, so downloads and extractions can overlap
+        logger.step(f"Downloading {len(github_plugins)} dependencies...")
+        with ThreadPoolExecutor(max_workers=min(4, len(github_plugins))) as executor:
+            futures = {
+                executor.submit(DownloadManager.download_plugin_from_github, project_dir, plugin_name): plugin_name
+                for plugin_name in github_plugins
+            }
+            for i, future in enumerate(as_completed(futures), 1):
+                plugin_name = futures[future]
+                logger.progress(i, len(github_plugins), f"Finished {plugin_name.replace('_', ' ').title()}")
+                if future.result():
+                    success_count += 1
+                else:
+                    logger.warning(f"Failed to download {plugin_name}")
         
         if success_count == len(github_plugins):
             logger.success(f"Downloaded all {len(github_plugins)} dependencies successfully")
@@ -475,20 +484,22 @@ class DownloadManager:
             exe_filename = f"{toolchain_version}.exe"
             exe_path = os.path.join(download_directory, exe_filename)
             
-            response = requests.get(download_url, stream=True)
-            response.raise_for_status()
-            
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded_size = 0
-            
-            with open(exe_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded_size += len(chunk)
-                        if total_size > 0:
-                            progress = (downloaded_size / total_size) * 100
-                            print(f"\rDownloading: {progress:.1f}%", end='', flush=True)
+            # Shared keep-alive session, so connection failures are retried like the other downloads
+            with http_session.get(download_url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                
+                total_size = int(response.headers.get('content-length', 0))
+                downloaded_size = 0
+                
+                # 1 MiB chunks keep per-chunk progress writes cheap
+                with open(exe_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_BUFFER_SIZE):
+                        if chunk:
+                            f.write(chunk)
+                            downloaded_size += len(chunk)
+                            if total_size > 0:
+                                progress = (downloaded_size / total_size) * 100
+                                print(f"\rDownloading: {progress:.1f}%", end='', flush=True)
             
             print()  # New line after progress
             logger.success(f"Downloaded {exe_filename}")
@@ -5,26 +5,88 @@ import json
 import os
 import re
 import shutil
+import threading
 import uuid
 import xml.etree.ElementTree as ET
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from core.config_manager import config
 from core.exceptions import ConfigurationError
 from core.logger import logger
 
+# Archives with fewer members than this are extracted on the calling thread
+PARALLEL_UNZIP_MIN_MEMBERS = 16
+
+# Template files whose contents may reference the template name
+TEXT_EXTENSIONS = frozenset({".cpp", ".h", ".cs", ".ini", ".uproject"})
+# Larger "text" files are copied unchanged rather than read into memory and scanned
+MAX_TEMPLATE_TEXT_FILE_SIZE = 4 * 1024 * 1024
+
+@lru_cache(maxsize=None)
+def _case_insensitive_pattern(value: str) -> re.Pattern:
+    """Compiled case-insensitive pattern for a literal value, built once per value."""
+    return re.compile(re.escape(value), re.IGNORECASE)
+
+@lru_cache(maxsize=None)
+def _case_matching_replacer(new_value: str):
+    """re.sub callback returning new_value in the case of the matched text, built once per value."""
+    upper, lower, title = new_value.upper(), new_value.lower(), new_value.title()
+
+    def replace_with_matching_case(match):
+        original = match.group(0)
+        if original.isupper():
+            return upper
+        elif original.islower():
+            return lower
+        elif original.istitle():
+            return title
+        else:
+            return new_value
+
+    return replace_with_matching_case
+
+@lru_cache(maxsize=None)
+def _exact_case_replacement(old_value: str, new_value: str) -> Optional[str]:
+    """
+    Replacement for old_value as written, or None if old_value can overlap itself
+    (then str.replace and the regex could pick different occurrences).
+    """
+    folded = old_value.lower()
+    if any(folded.endswith(folded[:i]) for i in range(1, len(folded))):
+        return None
+    pattern = _case_insensitive_pattern(old_value)
+    return _case_matching_replacer(new_value)(pattern.match(old_value))
+
 class FileUtilityManager:
     """Utility methods for filesystem and metadata operations."""
 
     @staticmethod
-    def unzip(source_path: str, dest_path: str) -> None:
+    def unzip(source_path: str, dest_path: str, strip_prefix: str = "") -> None:
         """
         Extracts a zip archive to the given destination directory.
+        Larger archives are extracted concurrently (zlib releases the GIL while inflating).
+
+        Args:
+            source_path: Path to the zip archive.
+            dest_path: Directory to extract into.
+            strip_prefix: Only extract members under this archive folder (e.g. "Plugin/"),
+                placing them directly in dest_path.
         """
         try:
             with zipfile.ZipFile(source_path, 'r') as zip_ref:
-                zip_ref.extractall(dest_path)
+                members = zip_ref.infolist()
+                if strip_prefix:
+                    # zipfile validates entries against orig_filename, so renaming the target path is safe
+                    members = [m for m in members if m.filename.startswith(strip_prefix) and m.filename != strip_prefix]
+                    for member in members:
+                        member.filename = member.filename[len(strip_prefix):]
+                if len(members) < PARALLEL_UNZIP_MIN_MEMBERS:
+                    zip_ref.extractall(dest_path, members=members)
+                else:
+                    FileUtilityManager._extract_members_parallel(source_path, dest_path, members)
             logger.debug(f"Extracted archive: {os.path.basename(source_path)}")
         except zipfile.BadZipFile as e:
             logger.error(f"Failed to unzip {source_path} (bad zip): {e}")
@@ -33,6 +95,45 @@ class FileUtilityManager:
             logger.error(f"Unexpected error during unzip of {source_path}: {e}")
             raise
 
+    @staticmethod
+    def _extract_members_parallel(source_path: str, dest_path: str, members: List[zipfile.ZipInfo]) -> None:
+        """
+        Extract members on a thread pool. A ZipFile handle is not safe to read from several
+        threads, so each worker opens its own.
+        """
+        # Create every target directory once up front instead of from each worker
+        for parent in sorted({os.path.dirname(m.filename) for m in members}):
+            parts = parent.split('/')
+            if parent and '..' not in parts and ':' not in parent and not parent.startswith('/'):
+                try:
+                    os.makedirs(os.path.join(dest_path, *parts), exist_ok=True)
+                except OSError:
+                    # e.g. characters Windows rejects; zipfile sanitises these names when extracting
+                    pass
+
+        local = threading.local()
+        handles = []
+        handles_lock = threading.Lock()
+
+        def extract_member(member: zipfile.ZipInfo) -> None:
+            zip_ref = getattr(local, "zip_ref", None)
+            if zip_ref is None:
+                zip_ref = local.zip_ref = zipfile.ZipFile(source_path, 'r')
+                with handles_lock:
+                    handles.append(zip_ref)
+            try:
+                zip_ref.extract(member, dest_path)
+            except FileExistsError:
+                # Unusual member names are left to zipfile to sanitise, so their parents can still race
+                zip_ref.extract(member, dest_path)
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as executor:
+                list(executor.map(extract_member, members))
+        finally:
+            for zip_ref in handles:
+                zip_ref.close()
+
     @staticmethod
     def copy_file_to_directory(src: str, dst_dir: str) -> None:
         """
@@ -84,7 +185,9 @@ class FileUtilityManager:
         Ensures that the name starts with a letter (A-Z).
         """
         hash_object = hashlib.sha256(value.encode())  # Hash the asset ID
-        base32_encoded = base64.b32encode(hash_object.digest()).decode()  # Base32 encoding (A-Z, 2-7)
+        # Base32 encoding (A-Z, 2-7); 15 bytes give 24 characters, enough for the 20 we keep,
+        # and encode to the same prefix as the full digest
+        base32_encoded = base64.b32encode(hash_object.digest()[:15]).decode()
         project_name = base32_encoded[:20]  # Truncate to 20 characters
 
         # Ensure first character is a letter (A-Z)
@@ -127,113 +230,107 @@ class FileUtilityManager:
         
     @staticmethod 
     def delete_paths(paths_to_delete: List[str]) -> None:
-        """Delete files or directories based on their type."""
-        for path_pattern in paths_to_delete:
-            for matched_path in glob.glob(path_pattern):
-                if os.path.isfile(matched_path):
-                    FileUtilityManager.delete_file_if_exists(matched_path)
-                elif os.path.isdir(matched_path):
-                    FileUtilityManager.delete_directory_if_exists(matched_path)
-                else:
-                    logger.warning(f"Path does not exist or unknown type: {matched_path}")
-
-    @staticmethod 
-    def update_file_content(file_path: str, old_value: str, new_value: str) -> None:
         """
-        Replace old_value with new_value in the specified file, preserving case sensitivity.
+        Delete files or directories based on their type.
+        Matched paths are independent, so they are removed concurrently.
         """
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-        except (UnicodeDecodeError, IOError):
-            logger.debug(f"Skipping file due to read error: {file_path}")
+        matched_paths = [matched_path for path_pattern in paths_to_delete for matched_path in glob.glob(path_pattern)]
+        if not matched_paths:
             return
+        
+        with ThreadPoolExecutor(max_workers=min(32, len(matched_paths))) as executor:
+            list(executor.map(FileUtilityManager._delete_path, matched_paths))
 
-        new_content = FileUtilityManager.case_preserving_replace(old_value, new_value, content)
-        if content != new_content:
-            try:
-                with open(file_path, 'w', encoding='utf-8') as file:
-                    file.write(new_content)
-                logger.debug(f"Updated content in {os.path.basename(file_path)}")
-            except IOError:
-                logger.error(f"Error writing to file: {file_path}")
-    
-    @staticmethod 
-    def rename_file(file_path: str, old_value: str, new_value: str) -> None:
-        """
-        Rename the file if old_value is part of the file name, preserving case.
-        """
-        directory, file_name = os.path.split(file_path)
-        if old_value.lower() in file_name.lower():
-            new_file_name = FileUtilityManager.case_preserving_replace(old_value, new_value, file_name)
-            new_file_path = os.path.join(directory, new_file_name)
-            if not os.path.exists(new_file_path):
-                os.rename(file_path, new_file_path)
-                logger.debug(f"Renamed file: {file_name} -> {new_file_name}")
-    
-    @staticmethod 
-    def rename_directory(directory: str, old_value: str, new_value: str) -> str:
+    @staticmethod
+    def _delete_path(path: str) -> None:
+        """Delete a single file or directory."""
+        if os.path.isfile(path):
+            FileUtilityManager.delete_file_if_exists(path)
+        elif os.path.isdir(path):
+            FileUtilityManager.delete_directory_if_exists(path)
+        else:
+            logger.warning(f"Path does not exist or unknown type: {path}")
+
+    @staticmethod
+    def instantiate_template(template_dir: str, dest_dir: str, old_value: str, new_value: str) -> None:
         """
-        Rename directories that contain old_value in their names.
+        Copy a template tree to dest_dir in one pass, replacing old_value with new_value
+        (preserving case) in file and directory names and in the contents of text files.
         """
-        parent_dir = os.path.dirname(directory)
-        dir_name = os.path.basename(directory)
+        copy_jobs = []
+        FileUtilityManager._create_template_dirs(template_dir, dest_dir, old_value, new_value, copy_jobs)
 
-        if old_value.lower() in dir_name.lower():
-            new_dir_name = FileUtilityManager.case_preserving_replace(old_value, new_value, dir_name)
-            new_dir_path = os.path.join(parent_dir, new_dir_name)
+        # File copies/rewrites are independent small-file I/O, so overlap them on a thread pool
+        if copy_jobs:
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4, len(copy_jobs))) as executor:
+                list(executor.map(
+                    lambda job: FileUtilityManager._instantiate_template_file(*job, old_value, new_value),
+                    copy_jobs
+                ))
 
-            if not os.path.exists(new_dir_path):
-                os.rename(directory, new_dir_path)
-                logger.debug(f"Renamed directory: {dir_name} -> {new_dir_name}")
-                return new_dir_path  # Return the new directory path for further operations
-
-        return directory  # Return the original directory if no renaming occurred
-    
-    @staticmethod 
-    def is_text_file(file_path: str) -> bool:
+    @staticmethod
+    def _create_template_dirs(src_dir: str, dst_dir: str, old_value: str, new_value: str, copy_jobs: List[tuple]) -> None:
         """
-        Check if the file is a text file based on its extension.
+        Create the renamed directory tree and collect (source, destination, rewrite_content) for each file.
         """
-        text_extensions = {".cpp", ".h", ".cs", ".ini", ".uproject"}
-        return os.path.splitext(file_path)[1].lower() in text_extensions
-    
-    @staticmethod 
-    def update_directory_structure(directory: str, old_value: str, new_value: str) -> None:
+        os.makedirs(dst_dir, exist_ok=True)
+        with os.scandir(src_dir) as it:
+            entries = list(it)
+
+        # Entry names are already basenames, so build paths by concatenation instead of join/split
+        dst_prefix = dst_dir + os.sep
+        for entry in entries:
+            name = entry.name
+            dst_path = dst_prefix + FileUtilityManager.case_preserving_replace(old_value, new_value, name)
+            if entry.is_dir():
+                FileUtilityManager._create_template_dirs(entry.path, dst_path, old_value, new_value, copy_jobs)
+            else:
+                dot = name.rfind('.')
+                is_text = dot > 0 and name[dot:].lower() in TEXT_EXTENSIONS
+                rewrite_content = is_text and entry.stat().st_size <= MAX_TEMPLATE_TEXT_FILE_SIZE
+                copy_jobs.append((entry.path, dst_path, rewrite_content))
+
+    @staticmethod
+    def _instantiate_template_file(src: str, dst: str, rewrite_content: bool, old_value: str, new_value: str) -> None:
         """
-        Recursively replace old_value with new_value in files and rename directories.
+        Write a text file with old_value replaced, or copy any other file unchanged.
         """
-        for root, dirs, files in os.walk(directory, topdown=False):  # Traverse bottom-up for directory renaming
-            for file_name in files:
-                file_path = os.path.join(root, file_name)
-                if FileUtilityManager.is_text_file(file_path):
-                    FileUtilityManager.update_file_content(file_path, old_value, new_value)
-                FileUtilityManager.rename_file(file_path, old_value, new_value)
-
-            # Rename directories
-            for dir_name in dirs:
-                dir_path = os.path.join(root, dir_name)
-                FileUtilityManager.rename_directory(dir_path, old_value, new_value)
-    
+        if rewrite_content:
+            # Decode straight from the read so the raw bytes aren't kept alongside the text
+            try:
+                with open(src, 'rb') as file:
+                    content = file.read().decode('utf-8')
+            except UnicodeDecodeError:
+                logger.debug(f"Copying file unchanged due to decode error: {src}")
+                content = None
+
+            if content is not None:
+                new_content = FileUtilityManager.case_preserving_replace(old_value, new_value, content)
+                # case_preserving_replace hands back the same object when nothing matched
+                if new_content is not content:
+                    with open(dst, 'wb') as file:
+                        file.write(new_content.encode('utf-8'))
+                    logger.debug(f"Updated content in {os.path.basename(dst)}")
+                    return
+
+        shutil.copy2(src, dst)
+
     @staticmethod 
     def case_preserving_replace(old_value: str, new_value: str, text: str) -> str:
         """
         Replace old_value with new_value in the text, preserving the case of the original.
         """
-        # Define a function to replace with matching case
-        def replace_with_matching_case(match):
-            original = match.group(0)
-            if original.isupper():
-                return new_value.upper()
-            elif original.islower():
-                return new_value.lower()
-            elif original.istitle():
-                return new_value.title()
-            else:
-                return new_value
-
-        # Use re.sub with re.IGNORECASE for case-insensitive matching
-        return re.sub(re.escape(old_value), replace_with_matching_case, text, flags=re.IGNORECASE)
+        # Case-insensitive matching with a pattern compiled once per old_value
+        pattern = _case_insensitive_pattern(old_value)
+        # Most names and files never mention old_value; return them as-is without building a new string
+        matches = pattern.findall(text)
+        if not matches:
+            return text
+        # Usually every occurrence is spelled exactly as old_value; str.replace avoids a callback per match
+        exact_replacement = _exact_case_replacement(old_value, new_value)
+        if exact_replacement is not None and text.count(old_value) == len(matches):
+            return text.replace(old_value, exact_replacement)
+        return pattern.sub(_case_matching_replacer(new_value), text)
 
     @staticmethod
     def save_metadata(project_dir: str, metadata: Dict[str, Any]) -> None:
@@ -249,24 +346,32 @@ class FileUtilityManager:
         
         # Merge with existing data if present
         existing_data = {}
-        if os.path.exists(metadata_file):
-            try:
-                with open(metadata_file, "r", encoding="utf-8") as file:
-                    existing_data = json.load(file)
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                logger.warning("Existing metadata corrupted, will overwrite")
-            except Exception as e:
-                logger.error(f"Failed to read existing metadata: {e}")
+        try:
+            with open(metadata_file, "r", encoding="utf-8") as file:
+                existing_data = json.load(file)
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            logger.warning("Existing metadata corrupted, will overwrite")
+        except Exception as e:
+            logger.error(f"Failed to read existing metadata: {e}")
         
         # Merge new data into existing (new data takes precedence)
         existing_data.update(metadata)
         
+        # Serialise once and swap the file in, so an interrupted run never leaves half a file
+        temp_file = metadata_file + ".tmp"
         try:
-            with open(metadata_file, "w", encoding="utf-8") as file:
-                json.dump(existing_data, file, indent=4)
+            with open(temp_file, "wb") as file:
+                file.write(json.dumps(existing_data, indent=4).encode("utf-8"))
+            os.replace(temp_file, metadata_file)
             logger.info(f"Metadata saved to {metadata_file}")
         except Exception as e:
             logger.error(f"Failed to save metadata: {e}")
+            try:
+                os.remove(temp_file)
+            except OSError:
+                pass
 
     @staticmethod 
     def get_metadata(project_dir: str) -> Dict[str, Any]:
@@ -280,15 +385,14 @@ class FileUtilityManager:
         # Debug information
         logger.debug(f"Looking for metadata file at: {metadata_file}")
         
-        if not os.path.exists(metadata_file):
-            logger.warning("Metadata file not found. This may be a legacy project")
-            return {}
-        
         try:
             with open(metadata_file, "r", encoding="utf-8") as file:
                 metadata = json.load(file)
                 logger.debug(f"Successfully loaded metadata with keys: {list(metadata.keys())}")
                 return metadata
+        except FileNotFoundError:
+            logger.warning("Metadata file not found. This may be a legacy project")
+            return {}
         except (json.JSONDecodeError, UnicodeDecodeError) as e:
             logger.warning(f"Failed to load metadata from {metadata_file}. Returning empty metadata")
             return {}
@@ -296,6 +400,37 @@ class FileUtilityManager:
             logger.error(f"Unexpected error reading metadata: {e}")
             return {}
 
+    @staticmethod
+    def read_cache_file(file_name: str) -> Dict[str, Any]:
+        """
+        Read a JSON cache file from the tool's cache directory.
+        Returns an empty dict if the file is missing or can't be read.
+        """
+        cache_file = os.path.join(config.get_cache_directory(), file_name)
+        try:
+            with open(cache_file, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
+            logger.debug(f"Ignoring unreadable cache file {file_name}: {e}")
+            return {}
+
+    @staticmethod
+    def write_cache_file(file_name: str, data: Dict[str, Any]) -> None:
+        """
+        Write a JSON cache file to the tool's cache directory.
+        Failures are non-fatal since the cache can always be rebuilt.
+        """
+        cache_dir = config.get_cache_directory()
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(os.path.join(cache_dir, file_name), "w", encoding="utf-8") as file:
+                json.dump(data, file, indent=4)
+        except OSError as e:
+            logger.debug(f"Failed to write cache file {file_name}: {e}")
+
     @staticmethod
     def read_appdata_file(file_path: str) -> str:
         """
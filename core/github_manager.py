@@ -1,10 +1,25 @@
 import requests
+import json
 import os
+import shutil
+import threading
 import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+
+from core.file_utility_manager import FileUtilityManager
+from core.http_session import http_session
 from core.logger import logger
 
+# Records which release asset each downloaded file came from, so unchanged files can be reused
+DOWNLOAD_MANIFEST_FILE = ".convai_deps.json"
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+# Latest-release responses and their ETags, revalidated with conditional requests
+RELEASE_CACHE_FILE = "github_releases.json"
+_manifest_lock = threading.Lock()
+_release_cache_lock = threading.Lock()
+
 class GitHubManager:
     """
     Manages GitHub API interactions for downloading releases and assets.
@@ -25,18 +40,34 @@ class GitHubManager:
         """
         api_url = f"https://api.github.com/repos/{repo}/releases/latest"
         
-        for attempt in range(self.max_retries):
-            try:
-                logger.debug(f"Fetching latest release from {repo}, attempt {attempt + 1}...")
-                response = requests.get(api_url, timeout=30)
-                response.raise_for_status()
-                return response.json()
-            except requests.RequestException as e:
-                logger.debug(f"Failed to fetch release info (Attempt {attempt + 1}/{self.max_retries}): {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(2)
-                    
-        return None
+        # Revalidate a previously seen response; a 304 costs no body and no rate limit
+        cached = FileUtilityManager.read_cache_file(RELEASE_CACHE_FILE).get(repo) or {}
+        headers = {"If-None-Match": cached["etag"]} if cached.get("etag") and cached.get("release") else {}
+        
+        # Transient failures are retried with backoff by the shared session
+        try:
+            logger.debug(f"Fetching latest release from {repo}...")
+            response = http_session.get(api_url, headers=headers, timeout=30)
+            if response.status_code == 304 and headers:
+                logger.debug(f"Latest release of {repo} unchanged, using cached response")
+                return cached["release"]
+            response.raise_for_status()
+            release_info = response.json()
+        except (requests.RequestException, ValueError) as e:
+            logger.debug(f"Failed to fetch release info: {e}")
+            return None
+        
+        etag = response.headers.get("ETag")
+        if etag:
+            self._cache_latest_release(repo, etag, release_info)
+        return release_info
+
+    @staticmethod
+    def _cache_latest_release(repo: str, etag: str, release_info: Dict) -> None:
+        with _release_cache_lock:
+            cache = FileUtilityManager.read_cache_file(RELEASE_CACHE_FILE)
+            cache[repo] = {"etag": etag, "release": release_info}
+            FileUtilityManager.write_cache_file(RELEASE_CACHE_FILE, cache)
 
     def get_release_by_tag(self, repo: str, tag: str) -> Optional[Dict]:
         """
@@ -51,18 +82,14 @@ class GitHubManager:
         """
         api_url = f"https://api.github.com/repos/{repo}/releases/tags/{tag}"
         
-        for attempt in range(self.max_retries):
-            try:
-                logger.debug(f"Fetching release {tag} from {repo}, attempt {attempt + 1}...")
-                response = requests.get(api_url, timeout=30)
-                response.raise_for_status()
-                return response.json()
-            except requests.RequestException as e:
-                logger.debug(f"Failed to fetch release {tag} (Attempt {attempt + 1}/{self.max_retries}): {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(2)
-                    
-        return None
+        try:
+            logger.debug(f"Fetching release {tag} from {repo}...")
+            response = http_session.get(api_url, timeout=30)
+            response.raise_for_status()
+            return response.json()
+        except requests.RequestException as e:
+            logger.debug(f"Failed to fetch release {tag}: {e}")
+            return None
 
     def find_matching_asset(self, assets: List[Dict], patterns: List[str]) -> Optional[Dict]:
         """
@@ -84,7 +111,7 @@ class GitHubManager:
 
     def download_file_from_url(self, url: str, file_path: str, filename: str) -> bool:
         """
-        Download a file from a URL with progress tracking and retry logic.
+        Download a file from a URL with retry logic.
         
         Args:
             url: Download URL
@@ -96,32 +123,23 @@ class GitHubManager:
         """
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         
+        # The session retries failed connections; this loop also covers transfers that break mid-stream
         for attempt in range(self.max_retries):
             try:
                 logger.debug(f"Downloading {filename} from GitHub, attempt {attempt + 1}...")
                 
-                response = requests.get(url, stream=True, timeout=30)
-                response.raise_for_status()
-                
-                total_size = int(response.headers.get('content-length', 0))
-                downloaded_size = 0
-                
-                with open(file_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                            downloaded_size += len(chunk)
-                            
-                            # Update progress every 10% for large files
-                            if total_size > 0:
-                                progress = (downloaded_size / total_size) * 100
-                                if progress % 10 < 1:  # Show progress every ~10%
-                                    logger.debug(f"Progress: {progress:.1f}%")
+                with http_session.get(url, stream=True, timeout=30) as response:
+                    response.raise_for_status()
+                    
+                    # Copy in 1 MiB blocks straight from the socket instead of many small chunks
+                    response.raw.decode_content = True
+                    with open(file_path, 'wb', buffering=DOWNLOAD_BUFFER_SIZE) as f:
+                        shutil.copyfileobj(response.raw, f, length=DOWNLOAD_BUFFER_SIZE)
                 
-                logger.debug(f"Download complete: {filename}")
+                logger.debug(f"Download complete: {filename} ({os.path.getsize(file_path)} bytes)")
                 return True
                 
-            except requests.RequestException as e:
+            except (requests.RequestException, Urllib3HTTPError) as e:
                 logger.debug(f"Download failed (Attempt {attempt + 1}/{self.max_retries}): {e}")
                 if attempt < self.max_retries - 1:
                     time.sleep(2)
@@ -178,26 +196,95 @@ class GitHubManager:
             logger.error("No download URL found in asset")
             return None
         
-        # Download the asset
+        # Reuse the file from a previous download if the release asset hasn't changed
         file_path = os.path.join(download_dir, asset_name)
+        if self._is_asset_downloaded(download_dir, repo, asset):
+            logger.debug(f"{asset_name} is unchanged, reusing existing download")
+            return file_path
+
+        # Download the asset
         if self.download_file_from_url(asset.get('browser_download_url'), file_path, asset_name):
+            self._record_asset_download(download_dir, repo, asset)
             return file_path
         else:
             logger.error(f"Failed to download {asset_name}")
             return None 
     
     @staticmethod
-    def get_file_content(repo: str, branch: str, file_path: str, max_retries: int = 3) -> Optional[str]:
-        """Get file content from GitHub using raw URL to avoid rate limits."""
-        raw_url = f"https://raw.githubusercontent.com/{repo}/{branch}/{file_path}"
+    def _read_download_manifest(download_dir: str) -> Dict:
+        manifest_path = os.path.join(download_dir, DOWNLOAD_MANIFEST_FILE)
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            return manifest if isinstance(manifest, dict) else {}
+        except (OSError, ValueError):
+            return {}
 
-        for attempt in range(max_retries):
+    @staticmethod
+    def _manifest_key(repo: str, asset_name: str) -> str:
+        # Different repos may publish assets with the same file name
+        return f"{repo}/{asset_name}"
+
+    @staticmethod
+    def _is_asset_downloaded(download_dir: str, repo: str, asset: Dict) -> bool:
+        """Check whether the asset on disk is the same release asset, by repo, id, upload time and size."""
+        # Downloads run concurrently; don't read the manifest while another worker is updating it
+        with _manifest_lock:
+            manifest = GitHubManager._read_download_manifest(download_dir)
+        entry = manifest.get(GitHubManager._manifest_key(repo, asset.get('name')))
+        if (not entry or entry.get('repo') != repo or entry.get('id') != asset.get('id')
+                or entry.get('updated_at') != asset.get('updated_at')):
+            return False
+        file_path = os.path.join(download_dir, asset.get('name'))
+        return os.path.isfile(file_path) and os.path.getsize(file_path) == asset.get('size')
+
+    @staticmethod
+    def _record_asset_download(download_dir: str, repo: str, asset: Dict) -> None:
+        """Record a finished download, replacing (and deleting) older assets from the same repo."""
+        asset_name = asset.get('name')
+        asset_key = GitHubManager._manifest_key(repo, asset_name)
+        with _manifest_lock:
+            manifest = GitHubManager._read_download_manifest(download_dir)
+            outdated = {key: entry for key, entry in manifest.items() if key != asset_key and entry.get('repo') == repo}
+            for key in outdated:
+                del manifest[key]
+            manifest[asset_key] = {
+                'repo': repo,
+                'name': asset_name,
+                'id': asset.get('id'),
+                'updated_at': asset.get('updated_at'),
+                'size': asset.get('size'),
+            }
+            # Delete files no longer tracked for any repo
+            tracked_names = {entry.get('name', key) for key, entry in manifest.items()}
+            for key, entry in outdated.items():
+                old_name = entry.get('name', key)
+                if old_name in tracked_names:
+                    continue
+                old_path = os.path.join(download_dir, old_name)
+                try:
+                    if os.path.isfile(old_path):
+                        os.remove(old_path)
+                except OSError as e:
+                    logger.debug(f"Could not remove outdated download {old_name}: {e}")
+            # Swap the new manifest in so it is never seen half-written
+            manifest_path = os.path.join(download_dir, DOWNLOAD_MANIFEST_FILE)
+            temp_path = manifest_path + ".tmp"
             try:
-                response = requests.get(raw_url, timeout=30)
-                response.raise_for_status()
-                return response.text
-            except requests.RequestException as e:
-                if attempt < max_retries - 1:
-                    time.sleep(2)
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(manifest, f, indent=4)
+                os.replace(temp_path, manifest_path)
+            except OSError as e:
+                logger.debug(f"Could not update download manifest: {e}")
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
 
-        return None
+    @staticmethod
+    def get_tracked_downloads(download_dir: str) -> Set[str]:
+        """Names of files in download_dir that are tracked release downloads."""
+        with _manifest_lock:
+            manifest = GitHubManager._read_download_manifest(download_dir)
+        # Entries from older manifests are keyed by file name alone
+        return {entry.get('name', key) for key, entry in manifest.items()}
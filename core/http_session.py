@@ -0,0 +1,28 @@
+"""Shared HTTP session for the Convai Modding Tool."""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def create_http_session() -> requests.Session:
+    """
+    Create a session that keeps connections alive between requests and retries
+    transient failures (connection errors, rate limiting, 5xx) with backoff.
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Global session instance
+http_session = create_http_session()
@@ -1,11 +1,16 @@
 import os
 import msvcrt
 import winreg
+from functools import lru_cache
 from pathlib import Path
 import re
+from typing import Optional, Tuple
 
 from core.config_manager import config
-from core.unreal_engine_manager import UnrealEngineManager
+from core.file_utility_manager import FileUtilityManager
+
+UE_PATH_CACHE_FILE = "unreal_engine_paths.json"
+PROJECT_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9_]{1,20}$")
 
 class InputManager:
     """Handles all user input prompts across the Convai Modding Tool."""
@@ -19,7 +24,9 @@ class InputManager:
         self.unreal_engine_path = None
 
     @staticmethod
-    def _find_registry_engines():
+    @lru_cache(maxsize=None)
+    def _find_registry_engines() -> Tuple[Tuple[str, str], ...]:
+        """Installed engines from the registry as (version, directory), enumerated once per run."""
         engines = []
         reg_path = r"SOFTWARE\\EpicGames\\Unreal Engine"  # ← raw string avoids the \U error
         try:
@@ -42,25 +49,23 @@ class InputManager:
         except FileNotFoundError:
             # Key doesn’t exist on this machine
             pass
-        return engines
+        return tuple(engines)
 
     def get_script_dir(self) -> str:
         return self.script_dir
     
     def get_user_flow_choice(self) -> str:
         if self._existing_projects is None:
-            self._existing_projects = []
-            for root, dirs, files in os.walk(self.script_dir):
-                if config.get_essentials_dir_name() in dirs and any(f.endswith('.uproject') for f in files):
-                    self._existing_projects.append(root)
+            self._existing_projects = self._find_existing_projects()
         if not self._existing_projects:
             return 'create'
         while True:
             target_ue_version = config.get_target_unreal_engine_version()
-            print('\nWhat do you want to do?')
-            print('1. Upload a new asset')
-            print('2. Update an existing asset')
-            print(f'3. Migrate an existing asset to {target_ue_version} UE version')
+            # One write per menu rather than one per line
+            print('\nWhat do you want to do?\n'
+                  '1. Upload a new asset\n'
+                  '2. Update an existing asset\n'
+                  f'3. Migrate an existing asset to {target_ue_version} UE version')
             choice = input('Enter your choice (1, 2, or 3): ').strip()
             if choice == '1':
                 return 'create'
@@ -70,6 +75,31 @@ class InputManager:
                 return 'migrate'
             print('Invalid input. Please enter 1, 2, or 3.')
 
+    def _find_existing_projects(self) -> list[str]:
+        """
+        Find modding projects in the script directory. Projects are always created as its
+        direct children, so only one level is scanned rather than walking every project's files.
+        """
+        essentials_dir_name = config.get_essentials_dir_name()
+        projects = []
+        with os.scandir(self.script_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                has_essentials = has_uproject = False
+                try:
+                    with os.scandir(entry.path) as children:
+                        for child in children:
+                            if child.name == essentials_dir_name and child.is_dir():
+                                has_essentials = True
+                            elif child.name.endswith('.uproject') and child.is_file():
+                                has_uproject = True
+                except OSError:
+                    continue
+                if has_essentials and has_uproject:
+                    projects.append(entry.path)
+        return projects
+
     def choose_project_dir(self) -> str:
         if self._existing_projects is None:
             self.get_user_flow_choice()
@@ -102,6 +132,9 @@ class InputManager:
         if version_type == "current" and self.unreal_engine_path:
             return self.unreal_engine_path
 
+        # Deferred so that startup doesn't import the engine/download machinery
+        from core.unreal_engine_manager import UnrealEngineManager
+
         # Get the appropriate version based on type
         if version_type == "target":
             required_ue_version = config.get_target_unreal_engine_version()
@@ -110,8 +143,40 @@ class InputManager:
             required_ue_version = config.get_current_unreal_engine_version()
             path_validation_function = UnrealEngineManager.is_valid_current_engine_path
 
+        # Reuse the path resolved on a previous run unless the user wants to pick one
+        engine_path = None
+        if not require_user_confirmation:
+            engine_path = self._load_ue_cache(required_ue_version, path_validation_function)
+        if not engine_path:
+            engine_path = self._find_unreal_engine_path(required_ue_version, path_validation_function, require_user_confirmation)
+            self._save_ue_cache(required_ue_version, engine_path)
+
+        if version_type == "current":
+            self.unreal_engine_path = engine_path
+        return engine_path
+
+    @staticmethod
+    def _load_ue_cache(required_ue_version: str, path_validation_function) -> Optional[str]:
+        """Return the cached engine path for this UE version if it is still a valid installation."""
+        cached_path = FileUtilityManager.read_cache_file(UE_PATH_CACHE_FILE).get(required_ue_version)
+        if cached_path and os.path.isdir(cached_path) and path_validation_function(Path(cached_path)):
+            return cached_path
+        return None
+
+    @staticmethod
+    def _save_ue_cache(required_ue_version: str, engine_path: str) -> None:
+        """Remember the resolved engine path for this UE version."""
+        cached_paths = FileUtilityManager.read_cache_file(UE_PATH_CACHE_FILE)
+        if cached_paths.get(required_ue_version) != engine_path:
+            cached_paths[required_ue_version] = engine_path
+            FileUtilityManager.write_cache_file(UE_PATH_CACHE_FILE, cached_paths)
+
+    def _find_unreal_engine_path(self, required_ue_version: str, path_validation_function, require_user_confirmation: bool) -> str:
+        """Locate an engine installation via the registry, falling back to asking the user."""
+        registry_engines = self._find_registry_engines()
+
         # 1) Try the registry
-        for registry_version, registry_path_str in self._find_registry_engines():
+        for registry_version, registry_path_str in registry_engines:
             registry_path_obj = Path(registry_path_str)
             if path_validation_function(registry_path_obj):
                 # Check if this registry version matches what we're looking for
@@ -121,14 +186,12 @@ class InputManager:
                         if user_response not in ("", "y", "yes"):
                             continue  # Skip this path and try next one
                     
-                    if version_type == "current":
-                        self.unreal_engine_path = str(registry_path_obj)
                     return str(registry_path_obj)
 
         # Show all available engines if exact match not found
         if require_user_confirmation:
             print(f"\nLooking for Unreal Engine {required_ue_version}...")
-        for registry_version, registry_path_str in self._find_registry_engines():
+        for registry_version, registry_path_str in registry_engines:
             registry_path_obj = Path(registry_path_str)
             if path_validation_function(registry_path_obj):
                 if require_user_confirmation:
@@ -136,8 +199,6 @@ class InputManager:
                     if user_response not in ("", "y", "yes"):
                         continue  # Skip this path and try next one
                 
-                if version_type == "current":
-                    self.unreal_engine_path = str(registry_path_obj)
                 return str(registry_path_obj)
 
         # 2) Last resort: ask the user
@@ -146,8 +207,6 @@ class InputManager:
             user_provided_engine_path = Path(user_input_path)
             if path_validation_function(user_provided_engine_path):
                 print(f"Using Unreal Engine path: {user_provided_engine_path}")
-                if version_type == "current":
-                    self.unreal_engine_path = str(user_provided_engine_path)
                 return str(user_provided_engine_path)
             print(f"Invalid path. Please enter a valid Unreal Engine {required_ue_version} directory.")
     
@@ -156,7 +215,6 @@ class InputManager:
             return self.project_name
         
         root = self.script_dir
-        name_pattern = re.compile(r"^[a-zA-Z0-9_]{1,20}$")  
 
         while True:
             name = input('Enter the Project Name : ').strip()
@@ -178,7 +236,7 @@ class InputManager:
                 continue
             
             # Check for invalid characters (only letters, digits, and underscores allowed)
-            if not name_pattern.match(name):
+            if not PROJECT_NAME_PATTERN.match(name):
                 print("Error: Project name can only contain letters, digits, and underscores (no spaces or special characters).")
                 continue
             
@@ -202,8 +260,11 @@ class InputManager:
                 if key and key.isalnum():
                     self.convai_api_key = key
                     return key
+                # Prompt again in place rather than recursing on every invalid attempt
                 print('Invalid API key. Please enter a valid alphanumeric key.')
-                return self.get_api_key()
+                print('Enter the Convai API key: ', end='', flush=True)
+                key = ''
+                continue
             if ch == b'\x08':
                 if key:
                     key = key[:-1]
@@ -220,9 +281,9 @@ class InputManager:
         if self.asset_type and self.is_metahuman is not None:
             return self.asset_type, self.is_metahuman
         while True:
-            print('Select the type of asset you want to create:')
-            print('1. Scene')
-            print('2. Avatar')
+            print('Select the type of asset you want to create:\n'
+                  '1. Scene\n'
+                  '2. Avatar')
             choice = input('Enter your choice (1 or 2): ').strip()
             if choice == '1':
                 self.asset_type, self.is_metahuman = 'Scene', False
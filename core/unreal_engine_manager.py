@@ -1,16 +1,18 @@
 import json
 import os
 import re
-import shutil
 import subprocess
 from pathlib import Path
 
 from core.config_manager import config
 from core.download_utils import DownloadManager
 from core.file_utility_manager import FileUtilityManager
+from core.github_manager import GitHubManager
 from core.plugin_manager import PluginManager
 from core.logger import logger
 
+ENGINE_VERSION_PATTERN = re.compile(r"#define\s+ENGINE_(MAJOR|MINOR)_VERSION\s+(\d+)")
+
 class UnrealEngineManager:
     """
     Manages Unreal Engine operations: project setup, building, plugins, and INI configuration.
@@ -158,9 +160,8 @@ class UnrealEngineManager:
             return False
 
         template = os.path.join(self.ue_dir, "Templates", "TP_Blank")
-        shutil.copytree(template, self.project_dir)
+        FileUtilityManager.instantiate_template(template, self.project_dir, "TP_Blank", self.project_name)
         os.makedirs(os.path.join(self.project_dir, 'Content'), exist_ok=True)
-        FileUtilityManager.update_directory_structure(self.project_dir, "TP_Blank", self.project_name)
         UnrealEngineManager.set_engine_version(
             os.path.join(self.project_dir, f"{self.project_name}.uproject"),
             self.engine_version
@@ -187,8 +188,8 @@ class UnrealEngineManager:
         ]
         logger.info("Starting project compilation...")
         
-        # Run compilation with live output streaming (just like original)
-        result = subprocess.run(cmd, shell=True)
+        # Launch UBT directly (no cmd.exe in between); it inherits our console, so output streams live
+        result = subprocess.run(cmd)
         
         # Final status
         if result.returncode != 0:
@@ -203,10 +204,7 @@ class UnrealEngineManager:
 
     def enable_plugins(self, plugins: list[str]) -> None:
         uproject_path = os.path.join(self.project_dir, f"{self.project_name}.uproject")
-        enabled_count = 0
-        for plugin in plugins:
-            if self._enable_plugin(uproject_path, plugin):
-                enabled_count += 1
+        enabled_count = self._enable_plugins(uproject_path, plugins)
         logger.debug(f"Enabled {enabled_count} plugins in project")
 
     def create_content_only_plugin(self, plugin_name: str) -> None:
@@ -231,9 +229,12 @@ class UnrealEngineManager:
 
     def update_ini_files(self, plugin_name: str, api_key: str) -> None:
         logger.debug("Updating project configuration files...")
-        self._update_game_ini(self.project_dir, plugin_name)
-        self._update_engine_ini(self.project_dir, api_key)
-        self._update_input_ini(self.project_dir)
+        # Ensure the Config directory exists once for all three INI files
+        config_dir = os.path.join(self.project_dir, config.get_config_dir_name())
+        os.makedirs(config_dir, exist_ok=True)
+        self._update_game_ini(config_dir, plugin_name)
+        self._update_engine_ini(config_dir, api_key)
+        self._update_input_ini(config_dir)
 
     def update_modding_dependencies(self) -> None:
         logger.subsection("Analyzing Current Installation")
@@ -262,11 +263,17 @@ class UnrealEngineManager:
             paths_to_delete.append(convenience_pack_dir)
             content_pack_found = True
         
-        # Get zip files from ConvaiEssentials directory
+        # Get zip files from ConvaiEssentials directory; tracked downloads are kept so
+        # unchanged releases are reused instead of downloaded again
         zip_dir = os.path.join(self.project_dir, config.get_essentials_dir_name())
         zip_files = []
-        if os.path.exists(zip_dir):
-            zip_files = [os.path.join(zip_dir, f) for f in os.listdir(zip_dir) if f.lower().endswith(".zip")]
+        if os.path.isdir(zip_dir):
+            tracked_downloads = GitHubManager.get_tracked_downloads(zip_dir)
+            with os.scandir(zip_dir) as entries:
+                zip_files = [
+                    e.path for e in entries
+                    if e.is_file(follow_symlinks=False) and e.name.lower().endswith(".zip") and e.name not in tracked_downloads
+                ]
 
         # Log what was found
         if plugin_count > 0:
@@ -276,14 +283,10 @@ class UnrealEngineManager:
         if zip_files:
             logger.info(f"Found {len(zip_files)} zip file(s) to clean up")
 
-        # Delete old installations and download fresh copies
-        if paths_to_delete:
-            logger.step(f"Removing {len(paths_to_delete)} existing installation(s)...")
-            FileUtilityManager.delete_paths(paths_to_delete)
-        
-        if zip_files:
-            logger.step("Cleaning up old zip files...")
-            FileUtilityManager.delete_paths(zip_files)
+        # Delete old installations and zip files in one batch, then download fresh copies
+        if paths_to_delete or zip_files:
+            logger.step(f"Removing {len(paths_to_delete)} existing installation(s) and {len(zip_files)} old zip file(s)...")
+            FileUtilityManager.delete_paths(paths_to_delete + zip_files)
         
         logger.step("Downloading latest dependencies...")
         # Exclude main Convai plugin from updates - only update helper plugins
@@ -431,14 +434,13 @@ class UnrealEngineManager:
         try:
             with open(version_file, 'r', encoding='utf-8') as f:
                 for line in f:
-                    m1 = re.search(r"ENGINE_MAJOR_VERSION\s+(\d+)", line)
-                    m2 = re.search(r"ENGINE_MINOR_VERSION\s+(\d+)", line)
-                    if m1:
-                        version['major'] = m1.group(1)
-                    if m2:
-                        version['minor'] = m2.group(1)
-            if 'major' in version and 'minor' in version:
-                return f"{version['major']}.{version['minor']}"
+                    match = ENGINE_VERSION_PATTERN.search(line)
+                    if match:
+                        version[match.group(1)] = match.group(2)
+                        if len(version) == 2:
+                            break
+            if 'MAJOR' in version and 'MINOR' in version:
+                return f"{version['MAJOR']}.{version['MINOR']}"
         except Exception as e:
             logger.error(f"Error reading engine version: {e}")
         return None
@@ -550,42 +552,41 @@ class UnrealEngineManager:
             return False
 
     @staticmethod
-    def _enable_plugin(
+    def _enable_plugins(
         uproject_path: str,
-        name: str,
-        marketplace_url: str = "",
-    ) -> bool:
+        names: list[str],
+    ) -> int:
+        """Add every missing plugin entry to the .uproject in a single read/write."""
         try:
             with open(uproject_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-            data.setdefault('Plugins', [])
-            if any(x.get('Name') == name for x in data['Plugins']):
-                return False
-            entry = {'Name': name, 'Enabled': True}
-            if marketplace_url:
-                entry['MarketplaceURL'] = marketplace_url
-            data['Plugins'].append(entry)
+            plugins = data.setdefault('Plugins', [])
+            existing = {x.get('Name') for x in plugins}
+            new_entries = []
+            for name in names:
+                if name not in existing:
+                    existing.add(name)
+                    new_entries.append({'Name': name, 'Enabled': True})
+            if not new_entries:
+                return 0
+            plugins.extend(new_entries)
             with open(uproject_path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=4)
-            return True
+            return len(new_entries)
         except (json.JSONDecodeError, OSError) as e:
-            logger.debug(f"Failed to enable plugin: {e}")
-            return False
+            logger.debug(f"Failed to enable plugins: {e}")
+            return 0
 
     @staticmethod
-    def _update_game_ini(project_dir: str, plugin_name: str) -> None:
+    def _update_game_ini(config_dir: str, plugin_name: str) -> None:
         """
         Ensures required settings exist in DefaultGame.ini by overriding existing scalar keys
         and de-duplicating array-style (+/-) entries within their sections.
 
         Args:
-            project_dir (str): The path to your Unreal project directory.
+            config_dir (str): The project's existing Config directory.
             plugin_name (str): The name of the content-only plugin.
         """
-        # Ensure the Config directory exists
-        config_dir = os.path.join(project_dir, config.get_config_dir_name())
-        os.makedirs(config_dir, exist_ok=True)
-
         # Path to the DefaultGame.ini file
         default_game_ini_path = os.path.join(config_dir, config.get_config_file_name("default_game"))
 
@@ -619,18 +620,15 @@ MetaDataTagsForAssetRegistry=()
         logger.debug(f"Merged DefaultGame.ini with plugin: {plugin_name}")
 
     @staticmethod
-    def _update_engine_ini(project_dir: str, convai_api_key: str) -> None:
+    def _update_engine_ini(config_dir: str, convai_api_key: str) -> None:
         """
         Ensures required settings exist in DefaultEngine.ini by overriding existing scalar keys
         and de-duplicating array-style (+/-) entries within their sections.
 
         Args:
-            project_dir (str): The path to your Unreal project directory.
+            config_dir (str): The project's existing Config directory.
             api_key (str): The Convai API key entered by the user.
         """
-        config_dir = os.path.join(project_dir, config.get_config_dir_name())
-        os.makedirs(config_dir, exist_ok=True)
-
         default_engine_ini_path = os.path.join(config_dir, config.get_config_file_name("default_engine"))
 
         # Desired settings content (by section)
@@ -850,9 +848,7 @@ API_Key={convai_api_key}
         logger.debug("Merged DefaultEngine.ini with required settings and API key")
     
     @staticmethod
-    def _update_input_ini(project_dir: str) -> None:
-        config_dir = os.path.join(project_dir, config.get_config_dir_name())
-        os.makedirs(config_dir, exist_ok=True)
+    def _update_input_ini(config_dir: str) -> None:
         default_input_ini_path = os.path.join(config_dir, config.get_config_file_name("default_input"))
 
         # Desired settings content
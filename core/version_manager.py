@@ -1,14 +1,10 @@
 # core/self_VersionManager.py
-import json
 import sys
 import webbrowser
 
-from core.github_manager import GitHubManager
+from core.config_manager import config
 from core.logger import logger
 
-REPO = "Conv-AI/Convai-UnrealEngine-ModdingTool"
-BRANCH = "main"
-VERSION_JSON_PATH = "Version.json"
 LATEST_RELEASE_URL = "https://github.com/Conv-AI/Convai-UnrealEngine-ModdingTool/releases/latest"
 
 class VersionManager:
@@ -23,20 +19,13 @@ class VersionManager:
         logger.section("Updater")
         logger.step("Checking for updates...")
 
-        raw = GitHubManager.get_file_content(REPO, BRANCH, VERSION_JSON_PATH)
-        if not raw:
+        # Version.json was already downloaded alongside the remote config at startup
+        remote_version = config.get_latest_modding_tool_version()
+        if remote_version is None:
             logger.info("Could not fetch Version.json")
             VersionManager._prompt_open_download_page("Could not fetch Version.json.")
             return False
 
-        try:
-            data = json.loads(raw)
-            remote_version = data.get("modding-tool-version", "").strip()
-        except Exception:
-            logger.info("Invalid Version.json")
-            VersionManager._prompt_open_download_page("Invalid Version.json.")
-            return False
-
         logger.info(f"Current version: {current_version}")
         logger.info(f"Latest version:  {remote_version or 'unknown'}")
 